@@ -8,7 +8,7 @@ MATEMATİKSEL MANTIK VE PSEUDOKODuz:
 -----------------------------------
 
 XORSHIFT64* ALGORITMASI:
-  1. STATE (64-bit) ile başla
+  1. STATE (64-bit) ile başla (seed'den SplitMix64 ile türetilir)
   2. Her iterasyonda şu işlemleri yap:
      x ^= x << 12    (sol kaydır 12 bit, XOR ile karıştır)
      x ^= x >> 25    (sağ kaydır 25 bit, XOR ile karıştır)
@@ -23,6 +23,12 @@ VON NEUMANN WHITENING (Bias Removal):
   4. Eğer (0,0) veya (1,1) ise → bu çifti yoksay (discardla)
   5. Bu şekilde 0 ve 1'lerin matematiksel olarak eşit dağılması sağlanır
 
+XOSHIRO256++ ALGORITMASI (isteğe bağlı, engine="xoshiro256++"):
+  1. 4 adet 64-bit STATE (s0..s3) ile başla (SplitMix64 ile türetilir)
+  2. Çıktı: rotl(s0 + s3, 23) + s0
+  3. State güncellemesi: XOR, 17 bit sola kaydırma ve 45 bit döndürme
+  4. Daha uzun periyot; whitening olmadan kullanılabilir
+
 BUŞ GERÇEKLEŞTİRME:
   - Temel Xorshift64* algoritması
   - Von Neumann whitening ile istatistiksel balans
@@ -32,105 +38,406 @@ BUŞ GERÇEKLEŞTİRME:
 ================================================================================
 """
 
+import operator
+import sys
+
+
+def _splitmix64(z):
+    """
+    SplitMix64 karıştırma fonksiyonu (seed'den state türetmek için).
+    
+    Küçük veya birbirine yakın seed'ler (örn. 42 ve 43) doğrudan state
+    olarak kullanılırsa ilk çıktılar birbirine benzer ve az sayıda set bit
+    içerir. SplitMix64 her seed'i tüm 64 bite yayılmış bir değere çevirir.
+    
+    Args:
+        z (int): Girdi (64-bit)
+    
+    Returns:
+        int: Karıştırılmış 64-bit değer
+    """
+    z = (z + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return z ^ (z >> 31)
+
+
+def _build_von_neumann_table():
+    """
+    0-255 arasındaki her byte için Von Neumann whitening çıktısını hesapla.
+    
+    Bir byte 4 bit çifti içerir: (bit_0, bit_1), (bit_2, bit_3), ...
+    Çiftler tek tek karşılaştırılmaz (SWAR - bit paralel yöntem):
+      keep = (byte ^ (byte >> 1)) & 0x55   -> bitleri farklı olan çiftler
+      vals = byte & keep                   -> bu çiftlerin çıktı biti (bit_i)
+    Ardından keep içindeki set bitler düşükten yükseğe gezilir ve çıktı
+    bitleri bir tamsayıya sırayla (ilk bit en düşük pozisyonda) yerleştirilir.
+    Tablo modül yüklenirken bir kez hesaplanır.
+    
+    Returns:
+        tuple: 256 elemanlı tablo; her eleman (bitler, bit_sayısı) çifti
+    """
+    table = []
+    for byte in range(256):
+        # (0,1) -> 0, (1,0) -> 1; (0,0) ve (1,1) keep'te yer almaz
+        keep = (byte ^ (byte >> 1)) & 0x55
+        vals = byte & keep
+        
+        bits = 0
+        count = 0
+        while keep:
+            lsb = keep & -keep  # En düşük set bit
+            if vals & lsb:
+                bits |= 1 << count
+            count += 1
+            keep ^= lsb
+        table.append((bits, count))
+    return tuple(table)
+
+
+def _build_von_neumann_bytes(table):
+    """
+    16-bit'lik her değer için whitening çıktısını iki bytes tablosuna yaz.
+    
+    16 bit = 8 bit çifti; en fazla 8 çıktı biti üretir, yani hem çıktı
+    bitleri hem de bit sayısı tek bir byte'a sığar. Tuple yerine bytes
+    kullanıldığı için 65536 girişlik tablolar toplam 128 KB yer kaplar
+    ve her giriş için ayrı bir Python nesnesi oluşturulmaz.
+    
+    Args:
+        table (tuple): 8-bit tablo (_build_von_neumann_table çıktısı)
+    
+    Returns:
+        tuple: (bitler, bit_sayıları) - her biri 65536 uzunlukta bytes
+    """
+    bits = bytearray(65536)
+    counts = bytearray(65536)
+    for value in range(65536):
+        low_bits, low_count = table[value & 0xFF]
+        high_bits, high_count = table[value >> 8]
+        # Düşük byte'ın çıktısı önce gelir
+        bits[value] = low_bits | (high_bits << low_count)
+        counts[value] = low_count + high_count
+    return bytes(bits), bytes(counts)
+
+
+# Byte -> (whitening uygulanmış bitler, bit sayısı)
+_VON_NEUMANN_TABLE = _build_von_neumann_table()
+
+# 16-bit değer -> whitening uygulanmış bitler / bit sayısı
+_VON_NEUMANN_BITS, _VON_NEUMANN_COUNTS = _build_von_neumann_bytes(_VON_NEUMANN_TABLE)
+
+
+def _xorshift64_batch(state, n_words):
+    """
+    n_words adet ham Xorshift64* sayısı üret.
+    
+    PSEUDOKODuz:
+      x = state
+      x ^= x << 12
+      x ^= x >> 25
+      x ^= x << 27
+      state = x
+      return x * MAGIC_CONSTANT
+    
+    State ve sabitler döngü boyunca yerel değişkenlerde tutulur. 64-bit
+    taşma her turda tek bir mask ile temizlenir: x << 27 sonucu
+    mask'lenmez, çünkü sonraki turun ilk adımı (x ^ (x << 12)) & MASK
+    bu fazla bitleri zaten siler ve çarpımın alt 64 biti yalnızca x'in alt
+    64 bitine bağlıdır.
+    
+    Args:
+        state (int): Xorshift64* state'i (sıfır olmayan 64-bit)
+        n_words (int): Üretilecek sayı adedi
+    
+    Returns:
+        tuple: (yeni state, 64-bit sayıların listesi)
+    """
+    MASK = 0xFFFFFFFFFFFFFFFF
+    MAGIC = 2685821657736338717  # Magic constant (diffusion için)
+    x = state
+    words = []
+    append = words.append
+    
+    for _ in range(n_words):
+        x = (x ^ (x << 12)) & MASK  # 12 bit sola kaydır ve XOR
+        x ^= (x >> 25)              # 25 bit sağa kaydır ve XOR
+        x ^= (x << 27)              # 27 bit sola kaydır ve XOR
+        append((x * MAGIC) & MASK)
+    
+    # Son turun taşmasını temizle
+    return x & MASK, words
+
+
+def _xoshiro256pp_batch(state, n_words):
+    """
+    n_words adet Xoshiro256++ sayısı üret.
+    
+    PSEUDOKODuz (Blackman & Vigna):
+      result = rotl(s0 + s3, 23) + s0
+      t = s1 << 17
+      s2 ^= s0; s3 ^= s1; s1 ^= s2; s0 ^= s3
+      s2 ^= t
+      s3 = rotl(s3, 45)
+      return result
+    
+    Referans çıktı, state (1, 2, 3, 4) için (python -m doctest rng.py):
+    
+    >>> _xoshiro256pp_batch((1, 2, 3, 4), 6)[1]  # doctest: +NORMALIZE_WHITESPACE
+    [41943041, 58720359, 3588806011781223, 3591011842654386,
+     9228616714210784205, 9973669472204895162]
+    
+    Args:
+        state (tuple): 4 adet 64-bit state (hepsi birden sıfır olmamalı)
+        n_words (int): Üretilecek sayı adedi
+    
+    Returns:
+        tuple: (yeni state, 64-bit sayıların listesi)
+    """
+    MASK = 0xFFFFFFFFFFFFFFFF
+    s0, s1, s2, s3 = state
+    words = []
+    append = words.append
+    
+    for _ in range(n_words):
+        r = (s0 + s3) & MASK
+        append((((r << 23) | (r >> 41)) + s0) & MASK)
+        
+        t = (s1 << 17) & MASK
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
+        s2 ^= t
+        s3 = ((s3 << 45) | (s3 >> 19)) & MASK
+    
+    return (s0, s1, s2, s3), words
+
+
+def _whiten_words(words):
+    """
+    Ham sayılara Von Neumann whitening uygula.
+    
+    Bit çiftleri tek tek incelenmez; her ham sayının dört 16-bit parçası,
+    önceden hesaplanmış _VON_NEUMANN_BITS / _VON_NEUMANN_COUNTS
+    tablolarından geçirilir. Böylece her parçadaki 8 bit çifti tek bir
+    tablo erişimiyle işlenir.
+    
+    Çıktı bitleri önce küçük bir parça tamsayısında (chunk) toplanır;
+    512 biti geçen her parça (bitler, uzunluk) olarak listeye eklenir.
+    Parçalar sonunda komşu çiftler halinde birleştirilir (dengeli
+    birleştirme): her turda parça sayısı yarıya iner ve her bit yalnızca
+    log2(parça sayısı) kez kopyalanır. Büyüyen tek bir sonuca eklemek her
+    parçada tüm sonucu kopyalardı (karesel süre).
+    
+    Args:
+        words (list): 64-bit ham sayılar
+    
+    Returns:
+        tuple: (whitening uygulanmış bitler, bit sayısı)
+               İlk üretilen bit en düşük pozisyondadır.
+    """
+    table_bits = _VON_NEUMANN_BITS
+    table_counts = _VON_NEUMANN_COUNTS
+    chunks = []
+    lengths = []
+    chunk_bits = 0
+    chunk_len = 0
+    
+    for raw in words:
+        # Önce bu sayının bitleri küçük bir tamsayıda toplanır,
+        # sonra chunk'ın sonuna tek seferde eklenir.
+        # Parçalar düşük bitlerden başlayarak sırayla işlenir.
+        part = raw & 0xFFFF
+        word_bits = table_bits[part]
+        word_len = table_counts[part]
+        
+        part = (raw >> 16) & 0xFFFF
+        word_bits |= table_bits[part] << word_len
+        word_len += table_counts[part]
+        
+        part = (raw >> 32) & 0xFFFF
+        word_bits |= table_bits[part] << word_len
+        word_len += table_counts[part]
+        
+        part = raw >> 48
+        word_bits |= table_bits[part] << word_len
+        word_len += table_counts[part]
+        
+        chunk_bits |= word_bits << chunk_len
+        chunk_len += word_len
+        if chunk_len >= 512:
+            chunks.append(chunk_bits)
+            lengths.append(chunk_len)
+            chunk_bits = 0
+            chunk_len = 0
+    
+    chunks.append(chunk_bits)
+    lengths.append(chunk_len)
+    
+    # Komşu parçaları çiftler halinde birleştir; sonraki parça daha
+    # yüksek bitlere gider, böylece bit sırası korunur
+    while len(chunks) > 1:
+        merged = []
+        merged_lengths = []
+        for i in range(0, len(chunks) - 1, 2):
+            merged.append(chunks[i] | (chunks[i + 1] << lengths[i]))
+            merged_lengths.append(lengths[i] + lengths[i + 1])
+        if len(chunks) & 1:
+            merged.append(chunks[-1])
+            merged_lengths.append(lengths[-1])
+        chunks = merged
+        lengths = merged_lengths
+    
+    return chunks[0], lengths[0]
+
+
+# get_random_bits için '0'/'1' karakterlerini 0/1 byte'larına çeviren tablo
+_BIT_CHARS = bytes.maketrans(b"01", b"\x00\x01")
+
+# Toplu çekişlerde tek apply_whitening çağrısıyla alınan en fazla bit sayısı
+# (256 adet 64-bit sayı); çok büyük tamsayılar üzerinde kaydırma yapılmaz
+_BLOCK_BITS = 64 * 256
+
+# Desteklenen üreteçler: engine parametresi -> raporda görünen ad
+_ENGINE_NAMES = {
+    "xorshift64*": "Xorshift64*",
+    "xoshiro256++": "Xoshiro256++",
+}
+
+# engine parametresi -> ham sayı üreten fonksiyon: f(state, n) -> (state, liste)
+_ENGINE_BATCH = {
+    "xorshift64*": _xorshift64_batch,
+    "xoshiro256++": _xoshiro256pp_batch,
+}
+
+
 class XorshiftRNG:
     """
     Xorshift64* algoritması ile Von Neumann whitening kullanan
     kriptografik olmayan, yüksek kalitede rastgele sayı üreteci.
+    
+    Whitening fiziksel (bias'lı) kaynaklar için tasarlanmıştır; Xorshift64*
+    çıktısında ölçülebilir bir bit bias'ı yoktur. whiten=False ile ham
+    sayılar doğrudan kullanılır ve her ham sayının 64 bitinin tamamı
+    çıktıya gider (whitening ile ortalama 16 bit).
+    
+    engine="xoshiro256++" ile Xorshift64* yerine Xoshiro256++ kullanılır:
+    256-bit state, daha uzun periyot ve Xorshift64*'ın takıldığı
+    istatistiksel testleri (örn. PractRand) geçen bir çıktı. Bu üreteçle
+    whitening'i kapatmak (whiten=False) güvenle mümkündür.
     """
     
-    def __init__(self, seed=1234567890):
+    def __init__(self, seed=1234567890, whiten=True, engine="xorshift64*"):
         """
         RNG'yi başlat.
         
         Args:
-            seed (int): İlk state değeri (64-bit)
+            seed (int): Başlangıç değeri; state SplitMix64 ile türetilir
+            whiten (bool): Von Neumann whitening uygulansın mı
+            engine (str): "xorshift64*" veya "xoshiro256++"
         """
-        # State: İç durum değişkeni (64-bit)
+        if engine not in _ENGINE_NAMES:
+            raise ValueError(f"Bilinmeyen engine: {engine!r}")
+        self.engine = engine
+        # Ham sayı üreten fonksiyon bir kez seçilir (bkz. _next_words)
+        self._engine_batch = _ENGINE_BATCH[engine]
+        
         # Bit işlemleri için 64-bit mask
-        self.state = seed & 0xFFFFFFFFFFFFFFFF
-        if self.state == 0:
-            self.state = 1  # State sıfır olmamalı
+        seed &= 0xFFFFFFFFFFFFFFFF
+        if engine == "xoshiro256++":
+            # State: 4 adet 64-bit kelime, SplitMix64 dizisinin ilk 4 çıktısı
+            self.state = tuple(
+                _splitmix64((seed + i * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF)
+                for i in range(4)
+            )
+            if not any(self.state):
+                self.state = (1, 0, 0, 0)  # State tamamen sıfır olmamalı
+        else:
+            # State: İç durum değişkeni (64-bit)
+            self.state = _splitmix64(seed)
+            if self.state == 0:
+                self.state = 1  # State sıfır olmamalı
+        
+        self.whiten = whiten
         
-        # Whitening için buffer
-        self.bit_buffer = []
-        self.buffer_index = 0
+        # Whitening için buffer: bitler bir tamsayıda biriktirilir,
+        # en düşük bit sıradaki çıktı bitidir
+        self.bit_buffer = 0
+        self.bit_buffer_len = 0
     
-    def _xorshift64_raw(self):
+    def _next_words(self, n_words):
         """
-        Ham Xorshift64* algoritması.
+        Seçili üreteçten n_words adet ham 64-bit sayı üret.
         
-        PSEUDOKODuz:
-          x = state
-          x ^= x << 12
-          x ^= x >> 25
-          x ^= x << 27
-          state = x
-          return x * MAGIC_CONSTANT
+        Tüm ham sayı çekişleri bu metottan geçer; state'in türü (Xorshift64*
+        için int, Xoshiro256++ için 4'lü tuple) yalnızca engine'e ait
+        fonksiyon tarafından işlenir.
+        
+        Args:
+            n_words (int): Üretilecek sayı adedi
         
         Returns:
-            int: 64-bit ham rastgele sayı
+            list: 64-bit ham rastgele sayılar
         """
-        # Bitsel işlemler (XOR ve kaydırma)
-        x = self.state
-        
-        # İlk dönüşüm: 12 bit sola kaydır ve XOR
-        x ^= (x << 12) & 0xFFFFFFFFFFFFFFFF
-        
-        # İkinci dönüşüm: 25 bit sağa kaydır ve XOR
-        x ^= (x >> 25)
-        
-        # Üçüncü dönüşüm: 27 bit sola kaydır ve XOR
-        x ^= (x << 27) & 0xFFFFFFFFFFFFFFFF
-        
-        # State'i güncelle
-        self.state = x
-        
-        # Magic constant ile çarpmak (diffusion için)
-        MAGIC = 2685821657736338717
-        result = (x * MAGIC) & 0xFFFFFFFFFFFFFFFF
-        
-        return result
+        self.state, words = self._engine_batch(self.state, n_words)
+        return words
     
-    def _extract_bit(self, number, bit_pos):
+    def _fill_buffer_batch(self, n_words):
         """
-        Bir sayıdan belirli bir biti çıkar.
+        n_words adet ham sayıyı tek seferde üret ve Von Neumann whitening uygula.
         
-        Args:
-            number (int): Sayı
-            bit_pos (int): Bit pozisyonu (0 = en sağdaki bit)
+        Ham sayılar _whiten_words ile whitening'den geçirilir; whiten=False
+        ise ham sayıların 64 biti buffer'a olduğu gibi eklenir.
         
-        Returns:
-            int: 0 veya 1
+        Args:
+            n_words (int): Üretilecek 64-bit ham sayı adedi
         """
-        return (number >> bit_pos) & 1
+        words = self._next_words(n_words)
+        
+        if self.whiten:
+            bits, count = _whiten_words(words)
+        else:
+            # Sayılar byte olarak birleştirilip tek seferde tamsayıya çevrilir
+            data = b"".join([word.to_bytes(8, "little") for word in words])
+            bits = int.from_bytes(data, "little")
+            count = 64 * n_words
+        
+        self.bit_buffer |= bits << self.bit_buffer_len
+        self.bit_buffer_len += count
     
-    def _fill_buffer(self):
+    def _fill_buffer(self, min_bits=256):
         """
-        Von Neumann whitening ile buffer'ı doldu.
+        Buffer'da en az min_bits bit olana kadar batch'ler halinde doldur.
+        
+        Buffer tek tek ham sayılarla değil, eksik bit sayısına göre
+        boyutlandırılmış _fill_buffer_batch çağrılarıyla doldurulur:
+          - whiten=True: her ham sayı ortalama 16 bit üretir; eksik bit
+            başına 15/256 sayı (beklenenin ~%94'ü) istenir. Büyük batch
+            hedefin biraz altında kalır ve kalan kısım giderek küçülen
+            batch'lerle tamamlanır; böylece hedefin üzerinde buffer'da kalan
+            bit sayısı istek boyutundan bağımsız olarak küçük kalır
+            (generate_raw_bit / apply_whitening her çekişte buffer'ın
+            tamamını kaydırır).
+          - whiten=False: her ham sayı tam 64 bit verir; eksik bitleri
+            karşılayan en az sayıda ham sayı tek seferde istenir.
         
         PSEUDOKODuz:
-          while buffer'ın boş:
-              raw = xorshift64_raw() çalıştır
-              her 64 bit için:
-                  bit_pair = (bit_i, bit_{i+1}) al
-                  if bit_pair == (0,1): buffer'a 0 ekle
-                  if bit_pair == (1,0): buffer'a 1 ekle
-                  else: yoksay (whitening)
+          while len(buffer) < min_bits:
+              eksik = min_bits - len(buffer)
+              n = whiten ? eksik * 15/256 + 1 : ceil(eksik / 64)
+              fill_buffer_batch(n)
+        
+        Args:
+            min_bits (int): Buffer'da bulunması gereken en az bit sayısı
         """
-        while len(self.bit_buffer) < 32:  # En az 32 bit topla
-            raw = self._xorshift64_raw()
-            
-            # Ham sayıdan bit çiftlerini çıkar ve Von Neumann whitening uygula
-            for i in range(0, 64, 2):
-                bit1 = self._extract_bit(raw, i)
-                bit2 = self._extract_bit(raw, i + 1)
-                
-                # Von Neumann whitening kuralları
-                if bit1 == 0 and bit2 == 1:
-                    self.bit_buffer.append(0)
-                elif bit1 == 1 and bit2 == 0:
-                    self.bit_buffer.append(1)
-                # (0,0) ve (1,1) yoksay (bias removal için)
+        while self.bit_buffer_len < min_bits:
+            missing = min_bits - self.bit_buffer_len
+            if self.whiten:
+                self._fill_buffer_batch(((missing * 15) >> 8) + 1)
+            else:
+                # Whitening yoksa her ham sayı tam 64 bit verir
+                self._fill_buffer_batch((missing + 63) >> 6)
     
     def generate_raw_bit(self):
         """
@@ -139,10 +446,13 @@ class XorshiftRNG:
         Returns:
             int: 0 veya 1
         """
-        if len(self.bit_buffer) == 0:
+        if self.bit_buffer_len == 0:
             self._fill_buffer()
         
-        bit = self.bit_buffer.pop(0)
+        # En düşük biti al ve buffer'ı kaydır (O(1), liste kaydırması yok)
+        bit = self.bit_buffer & 1
+        self.bit_buffer >>= 1
+        self.bit_buffer_len -= 1
         return bit
     
     def apply_whitening(self, num_bits=8):
@@ -153,30 +463,104 @@ class XorshiftRNG:
             num_bits (int): Çıkarmak istenen bit sayısı
         
         Returns:
-            int: Whitening uygulanmış sayı
+            int: Whitening uygulanmış sayı (num_bits <= 0 ise 0)
         """
-        result = 0
-        for i in range(num_bits):
-            bit = self.generate_raw_bit()
-            result |= (bit << i)  # Biti pozisyona yerleştir
+        if num_bits <= 0:
+            return 0
+        
+        # Yeterli bit yoksa buffer'ı doldur; küçük istekler için de en az
+        # 256 bit üretilir ki dolum maliyeti birkaç çağrıya yayılsın
+        if self.bit_buffer_len < num_bits:
+            self._fill_buffer(max(num_bits, 256))
+        
+        # İlk num_bits biti tek seferde al: ilk bit en düşük pozisyonda
+        result = self.bit_buffer & ((1 << num_bits) - 1)
+        self.bit_buffer >>= num_bits
+        self.bit_buffer_len -= num_bits
         
         return result
     
+    def _next_u64(self):
+        """
+        Whitening uygulanmış 64-bit bir sayı üret.
+        
+        whiten=False ise buffer atlanır ve üretecin ham çıktısı döner.
+        
+        Returns:
+            int: 0 ile 2^64-1 arasında sayı
+        """
+        if not self.whiten:
+            return self._next_words(1)[0]
+        return self.apply_whitening(64)
+    
+    def _next_u64_batch(self, n):
+        """
+        n adet 64-bit sayıyı tek seferde üret.
+        
+        n kez _next_u64 çağırmakla aynı diziyi verir; ancak bitler buffer'dan
+        _BLOCK_BITS'lik bloklar halinde alınıp byte'lar üzerinden bölünür.
+        Blok boyutu sınırlı olduğundan n büyüdükçe süre doğrusal kalır.
+        
+        Args:
+            n (int): Sayı adedi
+        
+        Returns:
+            list: 0 ile 2^64-1 arasında sayılar
+        """
+        if not self.whiten:
+            return self._next_words(n)
+        
+        numbers = []
+        block = _BLOCK_BITS // 64
+        for start in range(0, n, block):
+            count = min(block, n - start)
+            data = self.apply_whitening(64 * count).to_bytes(8 * count, "little")
+            numbers += [int.from_bytes(data[i:i + 8], "little")
+                        for i in range(0, 8 * count, 8)]
+        return numbers
+    
     def get_random_number(self, max_value=256):
         """
         0 ile max_value arasında rastgele bir sayı üret.
         
+        Lemire'in çarp-kaydır yöntemi (multiply-shift):
+          x = 64-bit rastgele sayı
+          m = x * max_value              (128-bit çarpım)
+          sonuç = m >> 64                (üst 64 bit, 0..max_value-1)
+          m'nin alt 64 biti eşik değerinden küçükse x yeniden çekilir
+        Eşik (2^64 mod max_value) ancak alt 64 bit max_value'dan küçükse
+        hesaplanır; bu yüzden çoğu çağrıda hiç mod işlemi yapılmaz ve
+        reddetme olasılığı en fazla max_value / 2^64'tür.
+        
+        max_value 2'nin kuvveti ise (örn. 256) reddetme hiç gerekmez:
+        doğrudan log2(max_value) bit alınır.
+        
         Args:
             max_value (int): Üst sınır (varsayılan: 256)
         
         Returns:
             int: 0 ile max_value-1 arasında rastgele sayı
         """
-        # max_value için gereken bit sayısını hesapla
         if max_value <= 1:
             return 0
         
-        # Bit sayısını belirle
+        if max_value & (max_value - 1) == 0:
+            return self.apply_whitening(max_value.bit_length() - 1)
+        
+        if max_value <= 0x10000000000000000:
+            x = self._next_u64()
+            m = x * max_value
+            low = m & 0xFFFFFFFFFFFFFFFF
+            if low < max_value:
+                # Eşik: 2^64 mod max_value (dağılımı tam eşit yapar)
+                threshold = 0x10000000000000000 % max_value
+                while low < threshold:
+                    x = self._next_u64()
+                    m = x * max_value
+                    low = m & 0xFFFFFFFFFFFFFFFF
+            return m >> 64
+        
+        # 64 bitten büyük aralıklar: bit sayısı kadar üret ve reddet
         bit_length = max_value.bit_length()
         
         # Gerekli bit sayısı kadar whitening uygulanmış sayı üret
@@ -185,6 +569,79 @@ class XorshiftRNG:
             if num < max_value:
                 return num
     
+    def get_random_numbers(self, n, max_value=256):
+        """
+        0 ile max_value arasında n adet rastgele sayı üret.
+        
+        get_random_number'ı n kez çağırmak yerine gereken bitler tek bir
+        batch ile üretilir ve sayılara bölünür:
+          - max_value 2'nin kuvveti ise n * log2(max_value) bit bloklar
+            halinde alınır (256 için her sayı bir byte'tır)
+          - diğer sınırlar için n adet 64-bit sayı toplu olarak üretilir ve
+            her birine Lemire yöntemi uygulanır; reddedilen (çok nadir)
+            sayılar en sonda yeniden çekilir
+        
+        Args:
+            n (int): Sayı adedi
+            max_value (int): Üst sınır (varsayılan: 256)
+        
+        Returns:
+            list: 0 ile max_value-1 arasında sayılar
+        """
+        if n <= 0:
+            return []
+        
+        if max_value <= 1:
+            return [0] * n
+        
+        if max_value & (max_value - 1) == 0:
+            num_bits = max_value.bit_length() - 1
+            numbers = []
+            # Bitler _BLOCK_BITS'lik bloklar halinde alınır
+            block = max(1, _BLOCK_BITS // num_bits)
+            for start in range(0, n, block):
+                count = min(block, n - start)
+                value = self.apply_whitening(count * num_bits)
+                
+                if num_bits % 8 == 0:
+                    # Byte'a hizalı genişlikler bytes üzerinden doğrudan bölünür
+                    step = num_bits // 8
+                    data = value.to_bytes(count * step, "little")
+                    if step == 1:
+                        numbers += data
+                    else:
+                        numbers += [int.from_bytes(data[i:i + step], "little")
+                                    for i in range(0, count * step, step)]
+                else:
+                    mask = (1 << num_bits) - 1
+                    numbers += [(value >> (i * num_bits)) & mask
+                                for i in range(count)]
+            return numbers
+        
+        if max_value > 0x10000000000000000:
+            return [self.get_random_number(max_value) for _ in range(n)]
+        
+        numbers = []
+        append = numbers.append
+        rejected = 0
+        threshold = None
+        for x in self._next_u64_batch(n):
+            m = x * max_value
+            low = m & 0xFFFFFFFFFFFFFFFF
+            if low < max_value:
+                if threshold is None:
+                    threshold = 0x10000000000000000 % max_value
+                if low < threshold:
+                    rejected += 1
+                    continue
+            append(m >> 64)
+        
+        # Reddedilenlerin yerine tek tek yeni sayı çek
+        for _ in range(rejected):
+            append(self.get_random_number(max_value))
+        
+        return numbers
+    
     def get_random_bits(self, n):
         """
         n adet rastgele bit üret.
@@ -195,10 +652,16 @@ class XorshiftRNG:
         Returns:
             list: 0 ve 1'lerden oluşan liste
         """
-        bits = []
-        for _ in range(n):
-            bits.append(self.generate_raw_bit())
-        return bits
+        if n <= 0:
+            return []
+        
+        # n biti tek bir batch ile al, sonra listeye aç (ilk bit en düşükte).
+        # Tamsayı her bit için yeniden kaydırılmaz: ikili gösterimi bir kez
+        # yazılır, ters çevrilir ve '0'/'1' karakterleri 0/1 byte'larına
+        # çevrilir; liste tek bir list() çağrısıyla, tam boyutta oluşur.
+        value = self.apply_whitening(n)
+        digits = format(value, f"0{n}b")[::-1].encode("ascii")
+        return list(digits.translate(_BIT_CHARS))
 
 
 # ================================================================================
@@ -216,91 +679,108 @@ def analyze_distribution(rng, count=1000):
     Returns:
         dict: İstatistiksel veriler
     """
-    print("=" * 80)
-    print("RASTGELE SAYI ÜRETECI (RNG) - İSTATİSTİKSEL ANALİZ RAPORU")
-    print("=" * 80)
-    print()
+    # Rapor satırları önce listede toplanır, sonunda tek seferde yazılır
+    out = []
+    out.append("=" * 80)
+    out.append("RASTGELE SAYI ÜRETECI (RNG) - İSTATİSTİKSEL ANALİZ RAPORU")
+    engine_name = _ENGINE_NAMES[rng.engine]
+    if rng.whiten:
+        out.append(f"Mod: {engine_name} + Von Neumann Whitening")
+    else:
+        out.append(f"Mod: Ham {engine_name} (whitening yok)")
+    out.append("=" * 80)
+    out.append("")
     
     # 1. BIT SEVİYESİ ANALİZİ
-    print("[1] BIT SEVİYESİ ANALİZİ")
-    print("-" * 80)
+    out.append("[1] BIT SEVİYESİ ANALİZİ")
+    out.append("-" * 80)
     bits = rng.get_random_bits(count * 8)
-    zeros = sum(1 for b in bits if b == 0)
-    ones = sum(1 for b in bits if b == 1)
+    # list.count tek bir C seviyesi geçişle sayar
+    zeros = bits.count(0)
+    ones = bits.count(1)
     
-    print(f"Toplam bit sayısı: {len(bits)}")
-    print(f"0 sayısı: {zeros} ({100*zeros/len(bits):.2f}%)")
-    print(f"1 sayısı: {ones} ({100*ones/len(bits):.2f}%)")
-    print(f"İdeal: Her biri ~50.00%")
-    print()
+    out.append(f"Toplam bit sayısı: {len(bits)}")
+    out.append(f"0 sayısı: {zeros} ({100*zeros/len(bits):.2f}%)")
+    out.append(f"1 sayısı: {ones} ({100*ones/len(bits):.2f}%)")
+    out.append(f"İdeal: Her biri ~50.00%")
+    out.append("")
     
     # 2. RASTGELE SAYI ANALİZİ (0-255 aralığı)
-    print("[2] RASTGELE SAYI ANALİZİ (0-255 aralığında)")
-    print("-" * 80)
-    numbers = [rng.get_random_number(256) for _ in range(count)]
+    out.append("[2] RASTGELE SAYI ANALİZİ (0-255 aralığında)")
+    out.append("-" * 80)
+    numbers = rng.get_random_numbers(count, 256)
     
     avg = sum(numbers) / len(numbers)
     min_val = min(numbers)
     max_val = max(numbers)
     
-    print(f"Üretilen sayı adedi: {len(numbers)}")
-    print(f"Ortalama (Average): {avg:.2f}")
-    print(f"Minimum: {min_val}")
-    print(f"Maksimum: {max_val}")
-    print(f"İdeal Ortalama: 127.50")
-    print()
+    out.append(f"Üretilen sayı adedi: {len(numbers)}")
+    out.append(f"Ortalama (Average): {avg:.2f}")
+    out.append(f"Minimum: {min_val}")
+    out.append(f"Maksimum: {max_val}")
+    out.append(f"İdeal Ortalama: 127.50")
+    out.append("")
     
     # 3. FREKANS DAĞILIMI (Histogram-benzeri)
-    print("[3] FREKANS DAĞILIMI (8 aralık)")
-    print("-" * 80)
-    buckets = [0] * 8
-    for num in numbers:
-        bucket_idx = num // 32  # 256/8 = 32
-        if bucket_idx < 8:
-            buckets[bucket_idx] += 1
+    out.append("[3] FREKANS DAĞILIMI (8 aralık)")
+    out.append("-" * 80)
+    bucket_ids = [num >> 5 for num in numbers]  # 256/8 = 32
+    buckets = [bucket_ids.count(i) for i in range(8)]
     
     for i, count_in_bucket in enumerate(buckets):
         start = i * 32
         end = (i + 1) * 32 - 1
         percentage = 100 * count_in_bucket / len(numbers)
         bar = "█" * int(percentage / 2)
-        print(f"[{start:3d}-{end:3d}]: {bar} {percentage:5.2f}% ({count_in_bucket})")
+        out.append(f"[{start:3d}-{end:3d}]: {bar} {percentage:5.2f}% ({count_in_bucket})")
     
-    print()
-    print(f"İdeal: Her aralık ~12.50%")
-    print()
+    out.append("")
+    out.append(f"İdeal: Her aralık ~12.50%")
+    out.append("")
     
     # 4. ARDIŞIK SAYI ÇIFTLERININ KORELASYONU
-    print("[4] ARDIŞIK SAYI KORELASYONU")
-    print("-" * 80)
+    out.append("[4] ARDIŞIK SAYI KORELASYONU")
+    out.append("-" * 80)
     if len(numbers) >= 2:
-        correlations = []
-        for i in range(len(numbers) - 1):
-            # Basit korelasyon: benzerlik derecesi
-            diff = abs(numbers[i] - numbers[i+1])
-            correlations.append(diff)
-        
-        avg_diff = sum(correlations) / len(correlations)
-        print(f"Ardışık sayılar arasında ortalama fark: {avg_diff:.2f}")
-        print(f"İdeal: ~85.00 (yüksek bağımsızlık göstergesi)")
-        print()
+        # Basit korelasyon: benzerlik derecesi (ardışık farkların ortalaması)
+        # map zinciri ara liste oluşturmadan tek geçişte toplanır
+        diffs = map(abs, map(operator.sub, numbers, numbers[1:]))
+        avg_diff = sum(diffs) / (len(numbers) - 1)
+        out.append(f"Ardışık sayılar arasında ortalama fark: {avg_diff:.2f}")
+        out.append(f"İdeal: ~85.00 (yüksek bağımsızlık göstergesi)")
+        out.append("")
     
     # 5. ÖZETz
-    print("[5] ÖZET")
-    print("-" * 80)
+    out.append("[5] ÖZET")
+    out.append("-" * 80)
     bit_balance = abs(zeros - ones)
-    print(f"Bit dengesi sapması: {bit_balance} (0'a yakın iyidir)")
-    print(f"Sayı dağılımı dengesi: {abs(avg - 127.5):.2f} (0'a yakın iyidir)")
-    print()
-    print("✓ Algoritma açıklanmıştır: Xorshift64* + Von Neumann Whitening")
-    print("✓ Yüksek entropi sağlanmıştır (XOR işlemleri)")
-    print("✓ İstatistiksel denge sağlanmıştır (Whitening)")
-    print("=" * 80)
+    out.append(f"Bit dengesi sapması: {bit_balance} (0'a yakın iyidir)")
+    out.append(f"Sayı dağılımı dengesi: {abs(avg - 127.5):.2f} (0'a yakın iyidir)")
+    out.append("")
+    if rng.whiten:
+        out.append(f"✓ Algoritma açıklanmıştır: {engine_name} + Von Neumann Whitening")
+    else:
+        out.append(f"✓ Algoritma açıklanmıştır: {engine_name} (ham çıktı)")
+    out.append("✓ Yüksek entropi sağlanmıştır (XOR işlemleri)")
+    if rng.whiten:
+        out.append("✓ İstatistiksel denge sağlanmıştır (Whitening)")
+    out.append("=" * 80)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
-    # RNG'yi başlat (seed ile)
+    # RNG'yi başlat (seed ile) ve analiz yap: önce whitening ile,
+    # sonra ham Xorshift64* ve ham Xoshiro256++ çıktısıyla
     rng = XorshiftRNG(seed=42)
+    analyze_distribution(rng, count=1000)
+    
+    print()
+    
+    rng = XorshiftRNG(seed=42, whiten=False)
+    analyze_distribution(rng, count=1000)
+    
+    print()
     
-    # Analiz yap
+    rng = XorshiftRNG(seed=42, whiten=False, engine="xoshiro256++")
     analyze_distribution(rng, count=1000)